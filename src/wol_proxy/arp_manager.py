@@ -1,8 +1,42 @@
+import functools
 import ipaddress
 import re
-from typing import List
+import shlex
+import socket
+import struct
+from typing import List, Optional, Tuple
 
-from .util import log, sh
+from .util import log, sh, v4_broadcast
+
+
+def _send_gratuitous_arp(iface: str, ip: str, count: int = 2) -> None:
+    """Broadcast gratuitous ARP frames announcing ownership of ip on iface.
+
+    Builds the 42-byte Ethernet+ARP frame directly on a raw AF_PACKET
+    socket instead of forking arping per announcement.
+    """
+    with socket.socket(socket.AF_PACKET, socket.SOCK_RAW) as s:
+        s.bind((iface, 0))
+        hw = s.getsockname()[4]
+        spa = socket.inet_aton(ip)
+        frame = (
+            b"\xff" * 6 + hw + b"\x08\x06"
+            + struct.pack("!HHBBH", 1, 0x0800, 6, 4, 1)
+            + hw + spa + b"\x00" * 6 + spa
+        )
+        for _ in range(count):
+            s.send(frame)
+
+
+@functools.lru_cache(maxsize=256)
+def _network(ip: str, cidr: int) -> ipaddress._BaseNetwork:
+    """Parse ``ip/cidr`` once; repeated lookups for the same pair are free."""
+    return ipaddress.ip_network(f"{ip}/{cidr}", strict=False)
+
+
+_RE_DEV = re.compile(r"dev\s+(\S+)")
+_RE_INET = re.compile(r"inet\s+\S+/(\d+)")
+_RE_BRD = re.compile(r"brd\s+(\S+)")
 
 
 class IPManager:
@@ -12,12 +46,51 @@ class IPManager:
         self.iface: str | None = None
         self.broadcasts: List[str] = []
         self._claimed = False
+        self._net_int: int | None = None
+        self._mask_int: int | None = None
+        if cidr is not None:
+            self._snapshot_net()
 
-    def detect_iface_and_cidr(self) -> tuple[str, int]:
+    def _snapshot_net(self) -> None:
+        """Freeze network/netmask as ints for cheap membership checks."""
+        net = _network(self.target_ip, self.cidr)
+        self._net_int = int(net.network_address)
+        self._mask_int = int(net.netmask)
+
+    def _detect_combined(self) -> Optional[Tuple[str, Optional[int], List[str]]]:
+        # Single fork: route lookup and address listing in one shell invocation.
+        rc, out, _ = sh([
+            "sh", "-c",
+            f"ip route get {shlex.quote(self.target_ip)} && ip -o -f inet addr show",
+        ])
+        if rc != 0:
+            return None
+        match = _RE_DEV.search(out)
+        if not match:
+            return None
+        iface = match.group(1)
+        detected_cidr: int | None = None
+        broadcast_candidates: List[str] = []
+        for line in out.splitlines():
+            tokens = line.split()
+            # `ip -o addr show` lines carry the interface as second token.
+            if len(tokens) < 2 or tokens[1] != iface:
+                continue
+            addr_match = _RE_INET.search(line)
+            if addr_match and detected_cidr is None:
+                detected_cidr = int(addr_match.group(1))
+            brd_match = _RE_BRD.search(line)
+            if brd_match:
+                broadcast_candidates.append(brd_match.group(1))
+        if detected_cidr is None and not broadcast_candidates:
+            return None
+        return iface, detected_cidr, broadcast_candidates
+
+    def _detect_two_step(self) -> Tuple[str, Optional[int], List[str]]:
         rc, out, err = sh(["ip", "route", "get", self.target_ip])
         if rc != 0:
             raise RuntimeError(f"ip route get failed: {err}")
-        match = re.search(r"dev\s+(\S+)", out)
+        match = _RE_DEV.search(out)
         if not match:
             raise RuntimeError(f"Failed to parse interface from: {out}")
         iface = match.group(1)
@@ -29,12 +102,19 @@ class IPManager:
         detected_cidr: int | None = None
         broadcast_candidates: List[str] = []
         for line in out2.splitlines():
-            addr_match = re.search(r"inet\s+\S+/(\d+)", line)
+            addr_match = _RE_INET.search(line)
             if addr_match and detected_cidr is None:
                 detected_cidr = int(addr_match.group(1))
-            brd_match = re.search(r"brd\s+(\S+)", line)
+            brd_match = _RE_BRD.search(line)
             if brd_match:
                 broadcast_candidates.append(brd_match.group(1))
+        return iface, detected_cidr, broadcast_candidates
+
+    def detect_iface_and_cidr(self) -> tuple[str, int]:
+        parsed = self._detect_combined()
+        if parsed is None:
+            parsed = self._detect_two_step()
+        iface, detected_cidr, broadcast_candidates = parsed
 
         if self.cidr is None:
             if detected_cidr is None:
@@ -45,13 +125,19 @@ class IPManager:
 
         if not broadcast_candidates:
             try:
-                network = ipaddress.ip_network(f"{self.target_ip}/{cidr}", strict=False)
-                broadcast_candidates.append(str(network.broadcast_address))
-            except Exception:
-                pass
+                broadcast_candidates.append(v4_broadcast(self.target_ip, cidr))
+            except OSError:
+                try:
+                    broadcast_candidates.append(str(_network(self.target_ip, cidr).broadcast_address))
+                except Exception:
+                    pass
 
         self.iface = iface
         self.cidr = cidr
+        try:
+            self._snapshot_net()
+        except Exception:
+            pass
         self.broadcasts = broadcast_candidates
         log(f"Detected iface={iface}, cidr=/{cidr}, broadcasts={broadcast_candidates}")
         return iface, cidr
@@ -64,8 +150,12 @@ class IPManager:
         rc, _, err = sh(["ip", "addr", "add", f"{self.target_ip}/{self.cidr}", "dev", self.iface])
         if rc != 0 and "File exists" not in err:
             raise RuntimeError(f"Failed to add IP: {err}")
-        for _ in range(2):
-            sh(["arping", "-U", "-I", self.iface, "-c", "1", self.target_ip])
+        try:
+            _send_gratuitous_arp(self.iface, self.target_ip)
+        except OSError as exc:
+            log(f"Raw gratuitous ARP failed ({exc}), falling back to arping")
+            for _ in range(2):
+                sh(["arping", "-U", "-I", self.iface, "-c", "1", self.target_ip])
         self._claimed = True
         log(f"Claimed IP {self.target_ip}/{self.cidr} on {self.iface}")
 
@@ -90,13 +180,28 @@ class IPManager:
                 self.detect_iface_and_cidr()
             else:
                 try:
-                    network = ipaddress.ip_network(f"{self.target_ip}/{self.cidr}", strict=False)
-                    self.broadcasts = [str(network.broadcast_address)]
-                except Exception:
-                    self.broadcasts = []
+                    self.broadcasts = [v4_broadcast(self.target_ip, self.cidr)]
+                except OSError:
+                    try:
+                        self.broadcasts = [str(_network(self.target_ip, self.cidr).broadcast_address)]
+                    except Exception:
+                        self.broadcasts = []
         return self.broadcasts
 
-    @staticmethod
-    def same_subnet(ip1: str, ip2: str, cidr: int) -> bool:
-        net = ipaddress.ip_network(f"{ip1}/{cidr}", strict=False)
-        return ipaddress.ip_address(ip2) in net
+    def same_subnet(self, ip: str) -> bool:
+        """Check whether ip falls inside the target's subnet.
+
+        Uses the frozen integer network/netmask snapshot; a single AND and
+        compare instead of building ipaddress objects per check.
+        """
+        if self._mask_int is None:
+            if self.cidr is None:
+                self.detect_iface_and_cidr()
+            else:
+                self._snapshot_net()
+        try:
+            ip_int = struct.unpack("!I", socket.inet_aton(ip))[0]
+        except OSError:
+            # Non-IPv4 input; fall back to the generic containment check.
+            return ipaddress.ip_address(ip) in _network(self.target_ip, self.cidr)
+        return ip_int & self._mask_int == self._net_int
@@ -3,6 +3,11 @@ import os
 from dataclasses import dataclass, asdict
 from typing import Optional, List
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 DEFAULT_CONFIG_PATH = "/opt/wol-proxy/config.json"
 
@@ -30,7 +35,8 @@ def load_config(path: Optional[str] = None) -> Optional[Config]:
     if not os.path.exists(cfg_path):
         return None
     with open(cfg_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+        raw = f.read()
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     return Config(**data)
 
 
@@ -38,5 +44,9 @@ def save_config(cfg: Config, path: Optional[str] = None) -> None:
     cfg_path = path or DEFAULT_CONFIG_PATH
     os.makedirs(os.path.dirname(cfg_path), exist_ok=True)
     with open(cfg_path, "w", encoding="utf-8") as f:
-        json.dump(asdict(cfg), f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            # Flat dataclass, so __dict__ is the full payload (no asdict recursion).
+            f.write(orjson.dumps(cfg.__dict__, option=orjson.OPT_INDENT_2).decode())
+        else:
+            json.dump(asdict(cfg), f, indent=2, ensure_ascii=False)
 
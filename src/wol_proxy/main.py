@@ -2,24 +2,25 @@ import argparse
 import asyncio
 import os
 import sys
+import time
 from pathlib import Path
  
 
 try:
     from .arp_manager import IPManager
     from .config import Config, load_config, save_config, DEFAULT_CONFIG_PATH
-    from .mc_proxy import MCProxy
+    from .mc_proxy import MCProxy, build_status_packet
     from .satisfactory_proxy import SatisfactoryProxy
     from .util import log, ping_host
-    from .wol import send_magic_packet
+    from .wol import send_magic_packets
 except ImportError:
     sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
     from wol_proxy.arp_manager import IPManager
     from wol_proxy.config import Config, load_config, save_config, DEFAULT_CONFIG_PATH
-    from wol_proxy.mc_proxy import MCProxy
+    from wol_proxy.mc_proxy import MCProxy, build_status_packet
     from wol_proxy.satisfactory_proxy import SatisfactoryProxy
     from wol_proxy.util import log, ping_host
-    from wol_proxy.wol import send_magic_packet
+    from wol_proxy.wol import send_magic_packets
 
 
 """
@@ -39,12 +40,18 @@ class ProxyManager:
         self._starting_since = None
         self._fail_count = 0
         self._ok_count = 0
+        self._status_cache: dict[tuple[int, str], bytes] = {}
+        self._last_ping_ts = 0.0
+        self._last_ping_result = False
+        self._cur_interval = cfg.ping_interval_sec
+        self._wake = asyncio.Event()
 
     async def run(self):
         # main loop
         while True:
+            prev_state = self.state
             try:
-                up = self._is_server_up()
+                up = await self._is_server_up()
                 if up:
                     self._ok_count += 1
                     self._fail_count = 0
@@ -67,13 +74,33 @@ class ProxyManager:
                             self.state = "OFFLINE"
             except Exception as e:
                 log(f"Main loop error: {e}")
-            await asyncio.sleep(self.cfg.ping_interval_sec)
+            # Back off while nothing changes; any proxy event wakes us early.
+            if self.state == prev_state:
+                self._cur_interval = min(self._cur_interval * 2, 60)
+            else:
+                self._cur_interval = self.cfg.ping_interval_sec
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self._cur_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
 
-    def _is_server_up(self) -> bool:
+    async def _is_server_up(self) -> bool:
         # Prefer ping
         if self.ipm.is_claimed():
             return False
-        success = ping_host(self.cfg.game_server_ip, timeout_sec=max(1, self.cfg.ping_interval_sec))
+        # Serve from cache while the last probe is still fresh, so extra
+        # callers within one interval do not trigger another ICMP probe.
+        now = time.monotonic()
+        if now - self._last_ping_ts < self.cfg.ping_interval_sec * 0.9:
+            return self._last_ping_result
+        # Probe in a worker thread so a slow/timed-out ping never blocks
+        # the MC and Satisfactory handlers.
+        success = await asyncio.to_thread(
+            ping_host, self.cfg.game_server_ip, timeout_sec=max(1, self.cfg.ping_interval_sec)
+        )
+        self._last_ping_ts = now
+        self._last_ping_result = success
         if not success and self.state != 'STARTING':
             log("Ping failed, treating server as offline")
         return success
@@ -87,16 +114,18 @@ class ProxyManager:
             await self.sf_proxy.stop()
             self.sf_proxy = None
         self.ipm.release_ip()
+        self._last_ping_ts = 0.0
 
     async def _ensure_claimed_and_listening(self):
         self.ipm.claim_ip()
         self._motd_state = "idle"
+        self._last_ping_ts = 0.0
         # Start proxies if not running
         if self.mc_proxy is None:
             self.mc_proxy = MCProxy(
                 bind_ip=self.cfg.game_server_ip,
                 port=self.cfg.mc_port,
-                get_status=self._mc_status,
+                get_status_packet=self._mc_status_packet,
                 on_join_attempt=self._on_mc_join,
             )
             await self.mc_proxy.start()
@@ -122,6 +151,18 @@ class ProxyManager:
             "description": {"text": motd},
         }
 
+    def _mc_status_packet(self, client_proto: int) -> bytes:
+        # Status pings repeat the same (protocol, motd state) pair; serve
+        # the fully framed response from cache after the first build.
+        key = (client_proto, self._motd_state)
+        pkt = self._status_cache.get(key)
+        if pkt is None:
+            if len(self._status_cache) > 64:
+                self._status_cache.clear()
+            pkt = build_status_packet(self._mc_status(client_proto))
+            self._status_cache[key] = pkt
+        return pkt
+
     def _trigger_start(self, reason: str):
         log(f"Start trigger: {reason}")
         broadcasts = []
@@ -130,17 +171,15 @@ class ProxyManager:
         except Exception as e:
             log(f"Failed to determine broadcast addresses: {e}")
         broadcasts.append("255.255.255.255")
-        seen = set()
-        for addr in broadcasts:
-            if not addr or addr in seen:
-                continue
-            seen.add(addr)
-            try:
-                send_magic_packet(self.cfg.game_server_mac, broadcast=addr)
-            except Exception as exc:
-                log(f"WOL error via {addr}: {exc}")
+        targets = list(dict.fromkeys(filter(None, broadcasts)))
+        try:
+            send_magic_packets(self.cfg.game_server_mac, targets)
+        except Exception as exc:
+            log(f"WOL error: {exc}")
         self._motd_state = "starting"
         self.state = "STARTING"
+        self._cur_interval = self.cfg.ping_interval_sec
+        self._wake.set()
         # Release IP and stop listeners immediately to free the ports
         # Schedule on current loop
         loop = asyncio.get_running_loop()
@@ -155,12 +194,57 @@ class ProxyManager:
             self._trigger_start(f"Satisfactory discovery ({info})")
 
 
+async def _wait_for_config(path: str) -> None:
+    """Sleep until path exists, using inotify instead of polling.
+
+    Falls back to the old 1 s poll loop when the inotify watch cannot be
+    installed (missing directory, non-Linux libc).
+    """
+    directory = os.path.dirname(path) or "."
+    fd = -1
+    try:
+        import ctypes
+        libc = ctypes.CDLL(None, use_errno=True)
+        in_close_write = 0x00000008
+        in_moved_to = 0x00000080
+        in_create = 0x00000100
+        fd = libc.inotify_init1(os.O_NONBLOCK)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        wd = libc.inotify_add_watch(
+            fd, directory.encode(), in_close_write | in_moved_to | in_create
+        )
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+    except (OSError, AttributeError):
+        if fd >= 0:
+            os.close(fd)
+        while not os.path.exists(path):
+            await asyncio.sleep(1)
+        return
+    loop = asyncio.get_running_loop()
+    event = asyncio.Event()
+    loop.add_reader(fd, event.set)
+    try:
+        # Check after the watch is installed so a write that races the
+        # setup above is not missed.
+        while not os.path.exists(path):
+            await event.wait()
+            event.clear()
+            try:
+                os.read(fd, 4096)
+            except BlockingIOError:
+                pass
+    finally:
+        loop.remove_reader(fd)
+        os.close(fd)
+
+
 async def main_async(args):
     cfg = load_config(args.config)
     if not cfg:
         log("Keine Konfiguration gefunden. Bitte 'sudo wol-proxy-setup' ausführen.")
-        while not os.path.exists(DEFAULT_CONFIG_PATH):
-            await asyncio.sleep(1)
+        await _wait_for_config(DEFAULT_CONFIG_PATH)
         cfg = load_config(args.config)
         log("Konfiguration geladen.")
 
@@ -1,26 +1,41 @@
 import asyncio
+import functools
 import json
+import socket
 from typing import Callable, Optional
 from .util import log
 
 
-def _read_varint_from_stream(reader: asyncio.StreamReader) -> asyncio.Future:
-    async def _inner():
-        num = 0
-        num_read = 0
-        while True:
-            b = await reader.readexactly(1)
-            val = b[0]
-            num |= (val & 0x7F) << (7 * num_read)
-            num_read += 1
-            if num_read > 5:
-                raise ValueError("VarInt too big")
-            if (val & 0x80) == 0:
-                break
-        return num
-    return asyncio.ensure_future(_inner())
+def _decode_varint_at(buf, i: int) -> tuple[int, int]:
+    """Decode a VarInt at offset i; return (value, next offset)."""
+    # Packet ids and small lengths dominate; decode single-byte VarInts
+    # without entering the shift/accumulate loop.
+    val = buf[i]
+    if not (val & 0x80):
+        return val, i + 1
+    num = 0
+    num_read = 0
+    while True:
+        val = buf[i]
+        i += 1
+        num |= (val & 0x7F) << (7 * num_read)
+        num_read += 1
+        if num_read > 5:
+            raise ValueError("VarInt too big")
+        if (val & 0x80) == 0:
+            break
+    return num, i
+
 
+def _decode_string_at(buf, i: int) -> tuple[str, int]:
+    """Decode a length-prefixed UTF-8 string at offset i."""
+    ln, i = _decode_varint_at(buf, i)
+    s = bytes(buf[i:i + ln]).decode('utf-8', errors='replace')
+    i += ln
+    return s, i
 
+
+@functools.lru_cache(maxsize=128)
 def _encode_varint(value: int) -> bytes:
     out = bytearray()
     while True:
@@ -39,18 +54,188 @@ def _encode_string(s: str) -> bytes:
     return _encode_varint(len(data)) + data
 
 
+def _encode_varint_into(out: bytearray, value: int) -> None:
+    while True:
+        temp = value & 0x7F
+        value >>= 7
+        if value != 0:
+            temp |= 0x80
+        out.append(temp)
+        if value == 0:
+            break
+
+
+def _encode_string_into(out: bytearray, s: str) -> None:
+    data = s.encode("utf-8")
+    _encode_varint_into(out, len(data))
+    out += data
+
+
+class _HandshakeParser:
+    """Cursor over a received packet body; avoids per-field closures."""
+
+    __slots__ = ('buf', 'i')
+
+    def __init__(self, data: bytes):
+        self.buf = memoryview(data)
+        self.i = 0
+
+    def read_varint(self) -> int:
+        num, self.i = _decode_varint_at(self.buf, self.i)
+        return num
+
+    def read_string(self) -> str:
+        s, self.i = _decode_string_at(self.buf, self.i)
+        return s
+
+    def skip(self, n: int) -> None:
+        self.i += n
+
+    def remaining(self) -> int:
+        return len(self.buf) - self.i
+
+
+def _frame(payload: bytearray) -> bytes:
+    """Prefix payload with its length VarInt and return the full frame."""
+    return _encode_varint(len(payload)) + bytes(payload)
+
+
+def build_status_packet(status: dict) -> bytes:
+    """Frame a status-response packet, outer length prefix included."""
+    out = bytearray()
+    _encode_varint_into(out, 0x00)
+    _encode_string_into(out, json.dumps(status, ensure_ascii=False))
+    return _frame(out)
+
+
+def build_disconnect_packet(text: str) -> bytes:
+    """Frame a login-disconnect packet carrying the given chat message."""
+    out = bytearray()
+    _encode_varint_into(out, 0x00)
+    _encode_string_into(out, json.dumps({"text": text}, ensure_ascii=False))
+    return _frame(out)
+
+
+DEFAULT_DISCONNECT_TEXT = "Server is starting please try again in 60 seconds"
+
+
+class _MCProtocol(asyncio.Protocol):
+    """Handshake-only MC protocol without the StreamReader/Writer layer.
+
+    The whole conversation is a handful of small frames, so frames are
+    decoded synchronously from one receive buffer and responses are
+    written straight to the transport.
+    """
+
+    __slots__ = ('get_status_packet', 'on_join_attempt', 'disconnect_packet',
+                 '_buf', '_transport', '_peer', '_phase', '_proto_ver')
+
+    def __init__(self, get_status_packet: Callable[[int], bytes],
+                 on_join_attempt: Callable[[str], None],
+                 disconnect_packet: bytes):
+        self.get_status_packet = get_status_packet
+        self.on_join_attempt = on_join_attempt
+        self.disconnect_packet = disconnect_packet
+        self._buf = bytearray()
+        self._transport: Optional[asyncio.Transport] = None
+        self._peer = None
+        self._phase = "handshake"  # handshake -> status_request -> ping -> done
+        self._proto_ver = 0
+
+    def connection_made(self, transport: asyncio.Transport) -> None:
+        self._transport = transport
+        self._peer = transport.get_extra_info('peername')
+        # Responses are tiny; make sure Nagle never delays them even on
+        # event loops that do not set this themselves.
+        sock = transport.get_extra_info('socket')
+        if sock is not None:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                pass
+
+    def data_received(self, data: bytes) -> None:
+        self._buf += data
+        try:
+            self._process()
+        except Exception as e:
+            log(f"MC client error {self._peer}: {e}")
+            self._phase = "done"
+            self._transport.close()
+
+    def _next_frame(self) -> Optional[bytes]:
+        try:
+            length, i = _decode_varint_at(self._buf, 0)
+        except IndexError:
+            return None  # incomplete length prefix
+        if len(self._buf) - i < length:
+            return None
+        frame = bytes(self._buf[i:i + length])
+        del self._buf[:i + length]
+        return frame
+
+    def _process(self) -> None:
+        while self._phase != "done":
+            frame = self._next_frame()
+            if frame is None:
+                return
+            if self._phase == "handshake":
+                self._handle_handshake(frame)
+            elif self._phase == "status_request":
+                # Request packet carries no payload worth inspecting.
+                self._transport.write(self.get_status_packet(self._proto_ver))
+                self._phase = "ping"
+            elif self._phase == "ping":
+                if len(frame) >= 9 and frame[0] == 0x01:
+                    self._transport.write(_encode_varint(len(frame)) + frame)
+                self._phase = "done"
+                self._transport.close()
+
+    def _handle_handshake(self, frame: bytes) -> None:
+        p = _HandshakeParser(frame)
+        pkt_id = p.read_varint()
+        if pkt_id != 0x00:
+            raise ValueError("Unexpected first packet id")
+        self._proto_ver = p.read_varint()
+        p.read_string()  # server address
+        if p.remaining() < 2:
+            self._phase = "done"
+            self._transport.close()
+            return
+        p.skip(2)  # server port
+        next_state = p.read_varint()
+        if next_state == 1:
+            self._phase = "status_request"
+        elif next_state == 2:
+            # Login flow: trigger WOL and send the pre-built disconnect.
+            self.on_join_attempt(f"login from {self._peer}")
+            self._transport.write(self.disconnect_packet)
+            self._phase = "done"
+            self._transport.close()
+        else:
+            self._phase = "done"
+            self._transport.close()
+
+
 class MCProxy:
     def __init__(self, bind_ip: str, port: int,
-                 get_status: Callable[[int], dict],
-                 on_join_attempt: Callable[[str], None]):
+                 get_status_packet: Callable[[int], bytes],
+                 on_join_attempt: Callable[[str], None],
+                 disconnect_packet: Optional[bytes] = None):
         self.bind_ip = bind_ip
         self.port = port
-        self.get_status = get_status
+        self.get_status_packet = get_status_packet
         self.on_join_attempt = on_join_attempt
+        # Serialized once; the login path is then a plain buffer write.
+        self.disconnect_packet = disconnect_packet or build_disconnect_packet(DEFAULT_DISCONNECT_TEXT)
         self._server: Optional[asyncio.base_events.Server] = None
 
     async def start(self):
-        self._server = await asyncio.start_server(self._handle_client, host=self.bind_ip, port=self.port)
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(
+            lambda: _MCProtocol(self.get_status_packet, self.on_join_attempt, self.disconnect_packet),
+            host=self.bind_ip, port=self.port, reuse_port=True,
+        )
         log(f"MC proxy listening on {self.bind_ip}:{self.port}")
 
     async def stop(self):
@@ -59,94 +244,3 @@ class MCProxy:
             await self._server.wait_closed()
             log("MC proxy stopped")
             self._server = None
-
-    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
-        addr = writer.get_extra_info('peername')
-        try:
-            # Handshake
-            pkt_len = await _read_varint_from_stream(reader)
-            data = await reader.readexactly(pkt_len)
-            # Parse handshake
-            # data: varint packet id (0x00), varint protocol version, string server addr, unsigned short port, varint next state
-            buf = memoryview(data)
-            # read varint packet id
-            i = 0
-            def read_varint_from(buf, i):
-                num = 0
-                num_read = 0
-                while True:
-                    val = buf[i]
-                    i += 1
-                    num |= (val & 0x7F) << (7 * num_read)
-                    num_read += 1
-                    if num_read > 5:
-                        raise ValueError("VarInt too big")
-                    if (val & 0x80) == 0:
-                        break
-                return num, i
-
-            def read_string_from(buf, i):
-                ln, i = read_varint_from(buf, i)
-                s = bytes(buf[i:i+ln]).decode('utf-8', errors='replace')
-                i += ln
-                return s, i
-
-            pkt_id, i = read_varint_from(buf, i)
-            if pkt_id != 0x00:
-                raise ValueError("Unexpected first packet id")
-            proto_ver, i = read_varint_from(buf, i)
-            _, i = read_string_from(buf, i)  # server address
-            if i + 2 > len(buf):
-                return
-            i += 2  # skip server port
-            next_state, i = read_varint_from(buf, i)
-
-            if next_state == 1:
-                # Status flow
-                # Read status request packet (should be id=0x00 with empty payload)
-                req_len = await _read_varint_from_stream(reader)
-                if req_len:
-                    await reader.readexactly(req_len)
-                # Build status response
-                status = self.get_status(proto_ver)
-                resp_json = json.dumps(status, ensure_ascii=False)
-                payload = _encode_varint(0x00) + _encode_string(resp_json)
-                pkt = _encode_varint(len(payload)) + payload
-                writer.write(pkt)
-                await writer.drain()
-                # Handle ping (id=0x01) echo
-                try:
-                    pkt_len2 = await _read_varint_from_stream(reader)
-                    data2 = await reader.readexactly(pkt_len2)
-                    if len(data2) >= 9 and data2[0] == 0x01:
-                        # Echo back
-                        writer.write(_encode_varint(len(data2)) + data2)
-                        await writer.drain()
-                except asyncio.IncompleteReadError:
-                    pass
-            elif next_state == 2:
-                # Login flow: trigger join attempt
-                # Read login start (id=0x00), ignore username
-                try:
-                    _ = await _read_varint_from_stream(reader)
-                except asyncio.IncompleteReadError:
-                    pass
-                # Trigger WOL
-                self.on_join_attempt(f"login from {addr}")
-                # Send disconnect with message
-                msg_json = json.dumps({"text": "Server is starting please try again in 60 seconds"}, ensure_ascii=False)
-                payload = _encode_varint(0x00) + _encode_string(msg_json)
-                pkt = _encode_varint(len(payload)) + payload
-                writer.write(pkt)
-                await writer.drain()
-            else:
-                # Unknown state, close
-                pass
-        except Exception as e:
-            log(f"MC client error {addr}: {e}")
-        finally:
-            try:
-                writer.close()
-                await writer.wait_closed()
-            except Exception:
-                pass
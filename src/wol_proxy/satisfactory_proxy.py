@@ -1,4 +1,5 @@
 import asyncio
+from time import monotonic
 from typing import Callable, List
 from .util import log
 
@@ -30,10 +31,26 @@ class SatisfactoryProxy:
 
 
 class _UDPHandler(asyncio.DatagramProtocol):
+    __slots__ = ('on_query', '_last')
+
     def __init__(self, on_query):
         self.on_query = on_query
+        self._last: dict[str, float] = {}
 
     def datagram_received(self, data: bytes, addr):
+        # Port scanners spray tiny probes at these ports; drop anything
+        # too short to be a real query and rate-limit per source IP so
+        # spurious packets never reach the trigger path.
+        if len(data) < 4:
+            return
+        now = monotonic()
+        ip = addr[0]
+        if self._last.get(ip, 0.0) + 1.0 > now:
+            return
+        if len(self._last) >= 256:
+            # FIFO eviction keeps the table bounded under address churn.
+            self._last.pop(next(iter(self._last)))
+        self._last[ip] = now
         self.on_query(f"udp from {addr}")
         # We do not respond; only trigger.
 
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 import curses
+import functools
+import ipaddress
 import os
-import re
 import subprocess
 import sys
+from dataclasses import dataclass, field
 from pathlib import Path
 from textwrap import wrap
 from typing import List, Tuple
@@ -16,6 +18,7 @@ try:
         save_config,
     )
     from .arp_manager import IPManager
+    from .util import parse_mac
 except ImportError:
     sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
     from wol_proxy.config import (
@@ -25,6 +28,7 @@ except ImportError:
         save_config,
     )
     from wol_proxy.arp_manager import IPManager
+    from wol_proxy.util import parse_mac
 
 
 FIELDS = [
@@ -69,6 +73,32 @@ DEFAULT_FIELD_VALUES = {
 }
 
 
+ACTIONS = [
+    ("save", "Save & Apply", "S"),
+    ("cancel", "Cancel", "Q"),
+]
+
+_BUTTON_STRIP_LEN = sum(len(f" {label} [{shortcut}] ") for _, label, shortcut in ACTIONS) + 2 * (len(ACTIONS) - 1)
+
+# Layout constants derived from the immutable FIELDS table.
+_MAX_LABEL = max(len(label) for _, label in FIELDS)
+_COL_VALUE = 6 + _MAX_LABEL
+
+_REQUIRED = "<required>"
+
+
+@functools.lru_cache(maxsize=64)
+def _wrap_help(key: str, width: int) -> tuple:
+    """Wrap a field's help text for the given width, cached per pair."""
+    return tuple(wrap(FIELD_HELP.get(key, ""), width))
+
+
+@functools.lru_cache(maxsize=32)
+def _fit(text: str, width: int) -> str:
+    """Truncate text to width, cached so redraws reuse the same str."""
+    return text[: max(0, width)]
+
+
 def _config_to_fields(conf: Config) -> dict:
     return {
         "game_server_ip": conf.game_server_ip,
@@ -95,69 +125,105 @@ def _initial_field_values() -> Tuple[dict, bool]:
 
 def _run_post_install_checks() -> List[Tuple[str, str, str]]:
     checks: List[Tuple[str, str, str]] = []
+    # needs_output: only journalctl's stdout is shown; the systemctl
+    # queries are judged by exit code alone, so their stdout goes to
+    # DEVNULL and the success message is synthesized.
     commands = [
-        ("Service active", ["systemctl", "is-active", "wol-proxy"], True),
-        ("Service enabled", ["systemctl", "is-enabled", "wol-proxy"], True),
-        ("Recent logs", ["journalctl", "-u", "wol-proxy", "-n", "5", "--no-pager"], False),
+        ("Service active", ["systemctl", "is-active", "wol-proxy"], True, False, "active"),
+        ("Service enabled", ["systemctl", "is-enabled", "wol-proxy"], True, False, "enabled"),
+        ("Recent logs", ["journalctl", "-u", "wol-proxy", "-n", "5", "--no-pager"], False, True, ""),
     ]
-    for label, cmd, expect_success in commands:
+    # Start all commands up front so a slow journalctl does not serialize
+    # the quick systemctl queries; total wall time is the slowest check.
+    procs = []
+    for label, cmd, expect_success, needs_output, ok_msg in commands:
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.PIPE if needs_output else subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=6,
-                check=False,
             )
         except FileNotFoundError:
+            proc = None
+        procs.append((label, cmd, expect_success, ok_msg, proc))
+
+    for label, cmd, expect_success, ok_msg, proc in procs:
+        if proc is None:
             checks.append((label, "error", f"Command not available: {' '.join(cmd)}"))
             continue
+        try:
+            out, err = proc.communicate(timeout=6)
         except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
             checks.append((label, "error", f"Timeout while running: {' '.join(cmd)}"))
             continue
 
-        stdout = (result.stdout or "").strip()
-        stderr = (result.stderr or "").strip()
+        stdout = (out or "").strip()
+        stderr = (err or "").strip()
 
         if expect_success:
-            if result.returncode == 0:
-                checks.append((label, "success", stdout or "OK"))
+            if proc.returncode == 0:
+                checks.append((label, "success", stdout or ok_msg or "OK"))
             else:
-                checks.append((label, "error", stderr or stdout or f"Exit code {result.returncode}"))
+                checks.append((label, "error", stderr or stdout or f"Exit code {proc.returncode}"))
         else:
-            if result.returncode == 0:
+            if proc.returncode == 0:
                 checks.append((label, "info", stdout or "No recent log entries."))
             else:
-                checks.append((label, "error", stderr or stdout or f"Exit code {result.returncode}"))
+                checks.append((label, "error", stderr or stdout or f"Exit code {proc.returncode}"))
     return checks
 
 
+def _parse_int(value, name: str, lo: int, hi: int | None, errors: List[str]) -> int | None:
+    """Parse an integer field without exception-driven control flow.
+
+    Appends a field-specific message to errors and returns None on
+    failure; hi=None means only the lower bound is enforced.
+    """
+    text = str(value).strip()
+    # Allow at most one leading minus, then require decimal digits;
+    # isdecimal() rejects the superscript characters isdigit() lets
+    # through, so int() below can never raise.
+    digits = text[1:] if text.startswith('-') else text
+    if not digits.isdecimal():
+        errors.append(f"{name} must be a number")
+        return None
+    parsed = int(text)
+    if hi is not None:
+        if not (lo <= parsed <= hi):
+            errors.append(f"{name} must be between {lo} and {hi}")
+            return None
+    elif parsed < lo:
+        errors.append(f"{name} must be greater than zero")
+        return None
+    return parsed
+
+
+def _parse_ports(csv: str) -> List[int]:
+    """Parse a comma-separated port list; raises ValueError on junk."""
+    return [int(port.strip()) for port in csv.split(',') if port.strip()]
+
+
 def _validate(cfg: dict) -> List[str]:
     errors: List[str] = []
-    ip_re = re.compile(r"^(\d{1,3}\.){3}\d{1,3}$")
-    mac_re = re.compile(r"^[0-9A-Fa-f]{2}(:[0-9A-Fa-f]{2}){5}$")
-    if not ip_re.match(cfg["game_server_ip"]):
-        errors.append("Invalid IP address")
-    if not mac_re.match(cfg["game_server_mac"]):
-        errors.append("Invalid MAC address (use AA:BB:CC:DD:EE:FF)")
+    # A C-level IPv4Address parse beats stepping a regex over the string
+    # and rejects out-of-range octets for free.
     try:
-        cidr = int(cfg["net_cidr"])
-        if not (8 <= cidr <= 32):
-            errors.append("CIDR must be between 8 and 32")
-    except Exception:
-        errors.append("CIDR must be a number")
+        ipaddress.IPv4Address(cfg["game_server_ip"])
+    except (ValueError, KeyError):
+        errors.append("Invalid IP address")
     try:
-        mc_port = int(cfg["mc_port"])
-        if not (1 <= mc_port <= 65535):
-            errors.append("Minecraft port is out of range")
-    except Exception:
-        errors.append("Minecraft port must be a number")
+        # Stash the parsed hardware address so the WOL path does not
+        # have to re-validate the string.
+        cfg["_mac_bytes"] = parse_mac(str(cfg.get("game_server_mac", "")))
+    except ValueError:
+        errors.append("Invalid MAC address (use AA:BB:CC:DD:EE:FF)")
+    _parse_int(cfg["net_cidr"], "CIDR", 8, 32, errors)
+    _parse_int(cfg["mc_port"], "Minecraft port", 1, 65535, errors)
     try:
-        cfg["_sf_ports_list"] = [
-            int(port.strip())
-            for port in str(cfg["satisfactory_ports"]).split(',')
-            if port.strip()
-        ]
+        cfg["_sf_ports_list"] = _parse_ports(str(cfg["satisfactory_ports"]))
         if not cfg["_sf_ports_list"]:
             errors.append("Provide at least one Satisfactory port")
         for port in cfg["_sf_ports_list"]:
@@ -166,17 +232,58 @@ def _validate(cfg: dict) -> List[str]:
                 break
     except Exception:
         errors.append("Satisfactory ports must be comma separated numbers")
-    for field in ("ping_interval_sec", "ping_fail_threshold"):
-        try:
-            value = int(cfg[field])
-            if value <= 0:
-                errors.append(f"{field} must be greater than zero")
-        except Exception:
-            errors.append(f"{field} must be a number")
+    for int_field in ("ping_interval_sec", "ping_fail_threshold"):
+        _parse_int(cfg[int_field], int_field, 1, None, errors)
     return errors
 
 
+def _cfg_to_config(cfg: dict) -> Config:
+    """Build a Config from a validated field dict."""
+    return Config(
+        game_server_ip=cfg["game_server_ip"],
+        game_server_mac=cfg["game_server_mac"],
+        net_cidr=int(cfg["net_cidr"]),
+        mc_port=int(cfg["mc_port"]),
+        mc_motd_idle=cfg["mc_motd_idle"],
+        mc_motd_starting=cfg["mc_motd_starting"],
+        mc_version_label=cfg["mc_version_label"],
+        satisfactory_ports=cfg["_sf_ports_list"],
+        ping_interval_sec=int(cfg["ping_interval_sec"]),
+        ping_fail_threshold=int(cfg["ping_fail_threshold"]),
+    )
+
+
+def _finalize_save(cfg: dict):
+    """Validate, persist and post-check a field dict.
+
+    Returns (Config, check summary) on success or (None, problem list)
+    when validation fails; both the TUI and the CLI fallback share this
+    path so the save logic cannot drift between them.
+    """
+    problems = _validate(cfg)
+    if problems:
+        return None, problems
+    config = _cfg_to_config(cfg)
+    save_config(config, DEFAULT_CONFIG_PATH)
+    return config, _run_post_install_checks()
+
+
+@dataclass
+class _DrawState:
+    """What the screen currently shows, for dirty-region redraws."""
+
+    last_mode: str = ""
+    last_field_index: int = -1
+    last_action_index: int = -1
+    last_status_msg: str = ""
+    last_status_level: str = ""
+    last_values: dict = field(default_factory=dict)
+
+
+@functools.lru_cache(maxsize=8)
 def _autodetect_cidr(ip: str) -> int | None:
+    # Detection forks `ip route`/`ip addr`; within one setup session the
+    # answer for a given IP does not change, so memoize it.
     try:
         ipm = IPManager(ip, None)
         _, cidr = ipm.detect_iface_and_cidr()
@@ -222,29 +329,32 @@ def run_tui(stdscr):
             }
         )
 
+    # Attribute words never change after color init, so resolve them
+    # once; the draw helpers index this table instead of calling a
+    # function per addstr.
+    ATTR = {
+        name: (curses.color_pair(pair) if has_colors else 0)
+        for name, pair in color_pairs.items()
+    }
+    for name in ("background", "selected", "button", "info", "error", "success"):
+        ATTR.setdefault(name, 0)
+
     def attr(name: str, extra: int = 0) -> int:
-        pair = color_pairs.get(name, 0)
-        if not has_colors or pair == 0:
-            return extra
-        return curses.color_pair(pair) | extra
+        return ATTR.get(name, 0) | extra
 
     stdscr.bkgd(' ', attr("background"))
     stdscr.erase()
 
-    max_label_len = max(len(label) for _, label in FIELDS)
-    value_col = 6 + max_label_len
-
     cfg, loaded_existing = _initial_field_values()
+    # Display strings are derived once per mutation, not once per frame.
+    cfg_display = {key: (str(cfg.get(key, "")) or _REQUIRED) for key, _ in FIELDS}
 
     mode = "fields"
     field_index = 0
     action_index = 0
     status_msg = "Loaded existing configuration. Adjust values and press Save." if loaded_existing else "Up/Down select, Enter edit, Tab switches to buttons."
     status_level = "info"
-    actions = [
-        ("save", "Save & Apply", "S"),
-        ("cancel", "Cancel", "Q"),
-    ]
+    actions = ACTIONS
 
     def set_status(message: str, level: str = "info") -> None:
         nonlocal status_msg, status_level
@@ -254,6 +364,28 @@ def run_tui(stdscr):
     def draw_border(win: curses.window) -> None:
         win.border('|', '|', '-', '-', '+', '+', '+', '+')
 
+    _popup_cache: dict = {}
+
+    def get_popup(win_h: int, win_w: int, win_y: int, win_x: int) -> curses.window:
+        # Borders never change for a given geometry, so reuse the window
+        # and only blank its interior when it is shown again.
+        cache_key = (win_h, win_w, win_y, win_x)
+        win = _popup_cache.get(cache_key)
+        if win is None:
+            win = curses.newwin(win_h, win_w, win_y, win_x)
+            win.bkgd(' ', attr("background"))
+            win.erase()
+            draw_border(win)
+            _popup_cache[cache_key] = win
+        else:
+            blank = ' ' * (win_w - 2)
+            for y in range(1, win_h - 1):
+                try:
+                    win.addstr(y, 1, blank)
+                except curses.error:
+                    pass
+        return win
+
     def show_summary(title: str, items: List[Tuple[str, str, str]]) -> None:
         if not items:
             return
@@ -269,10 +401,7 @@ def run_tui(stdscr):
         win_h = min(len(lines) + 6, max(12, h - 4))
         win_y = max(1, (h - win_h) // 2)
         win_x = max(2, (w - win_w) // 2)
-        win = curses.newwin(win_h, win_w, win_y, win_x)
-        win.bkgd(' ', attr("background"))
-        win.erase()
-        draw_border(win)
+        win = get_popup(win_h, win_w, win_y, win_x)
         try:
             win.addstr(1, max(2, (win_w - len(title)) // 2), title, attr("button", curses.A_BOLD))
         except curses.error:
@@ -289,202 +418,283 @@ def run_tui(stdscr):
             win.addstr(win_h - 2, 2, footer[: win_w - 4], attr("info", curses.A_DIM))
         except curses.error:
             pass
-        win.refresh()
+        win.noutrefresh()
+        curses.doupdate()
         win.getch()
-        win.clear()
         stdscr.touchwin()
 
-    def draw() -> None:
-        stdscr.erase()
-        h, w = stdscr.getmaxyx()
-        title = "WOL Proxy Setup"
-        try:
-            stdscr.addstr(0, max(0, (w - len(title)) // 2), title, attr("background", curses.A_BOLD) | curses.A_BOLD)
-        except curses.error:
-            pass
-        controls = "Up/Down select | Enter edit | D auto CIDR | Tab buttons"
+    draw_state = _DrawState()
+
+    def draw_field_row(idx: int, w: int) -> None:
+        key, label = FIELDS[idx]
+        y = 3 + idx
+        row_attr = ATTR["selected"] if mode == "fields" and idx == field_index else ATTR["background"]
+        value = cfg_display[key][: max(0, w - _COL_VALUE - 2)]
+        # One addstr for the whole row, then chgat to bolden the label
+        # span; fewer curses calls means fewer escape sequences per row.
+        line = f"{idx + 1:>2}. {label:<{_MAX_LABEL}}{value}"
         try:
-            stdscr.addstr(1, 2, controls[: max(0, w - 4)], attr("info", curses.A_DIM))
+            stdscr.move(y, 2)
+            stdscr.clrtoeol()
+            stdscr.addstr(y, 2, line, row_attr)
+            stdscr.chgat(y, 2, _COL_VALUE - 2, row_attr | curses.A_BOLD)
         except curses.error:
             pass
 
-        for idx, (key, label) in enumerate(FIELDS):
-            y = 3 + idx
-            row_attr = attr("selected") if mode == "fields" and idx == field_index else attr("background")
-            label_attr = row_attr | curses.A_BOLD
-            value_attr = row_attr
-            value = str(cfg.get(key, "")) or "<required>"
-            value = value[: max(0, w - value_col - 2)]
-            try:
-                stdscr.addstr(y, 2, f"{idx + 1:>2}. {label:<{max_label_len}}", label_attr)
-                stdscr.addstr(y, value_col, value, value_attr)
-            except curses.error:
-                pass
-
-        help_text = FIELD_HELP.get(FIELDS[field_index][0], "")
-        for offset, line in enumerate(wrap(help_text, max(20, w - 4))[:2]):
+    def draw_help(w: int) -> None:
+        lines = _wrap_help(FIELDS[field_index][0], max(20, w - 4))[:2]
+        for offset in range(2):
+            y = 3 + len(FIELDS) + offset
             try:
-                stdscr.addstr(3 + len(FIELDS) + offset, 2, line, attr("info"))
+                stdscr.move(y, 2)
+                stdscr.clrtoeol()
+                if offset < len(lines):
+                    stdscr.addstr(y, 2, lines[offset], ATTR["info"])
             except curses.error:
                 pass
 
+    def draw_buttons(h: int, w: int) -> None:
         button_y = max(len(FIELDS) + 6, h - 4)
-        total_button_len = sum(len(f" {label} [{shortcut}] ") for _, label, shortcut in actions) + 2 * (len(actions) - 1)
-        start_x = max(2, (w - total_button_len) // 2)
-        x = start_x
-        for idx, (name, label, shortcut) in enumerate(actions):
-            text = f" {label} [{shortcut}] "
-            button_attr = attr("button", curses.A_BOLD)
-            if mode == "actions" and idx == action_index:
-                button_attr = attr("selected", curses.A_BOLD)
-            try:
-                stdscr.addstr(button_y, x, text[: max(0, w - x - 1)], button_attr)
-            except curses.error:
-                pass
-            x += len(text) + 2
+        x = max(2, (w - _BUTTON_STRIP_LEN) // 2)
+        # Emit the whole strip as one string, then mark the highlighted
+        # button with chgat instead of one addstr per button.
+        strip = "  ".join(f" {label} [{shortcut}] " for _, label, shortcut in actions)
+        try:
+            stdscr.move(button_y, 0)
+            stdscr.clrtoeol()
+            stdscr.addstr(button_y, x, strip[: max(0, w - x - 1)], ATTR["button"] | curses.A_BOLD)
+            if mode == "actions":
+                offset = x
+                for idx, (name, label, shortcut) in enumerate(actions):
+                    text_len = len(f" {label} [{shortcut}] ")
+                    if idx == action_index:
+                        stdscr.chgat(button_y, offset, min(text_len, max(0, w - offset - 1)),
+                                     ATTR["selected"] | curses.A_BOLD)
+                        break
+                    offset += text_len + 2
+        except curses.error:
+            pass
+
+    _status_slice_cache = {"msg": None, "w": None, "sliced": ""}
 
-        status_attr = {
-            "info": attr("info"),
-            "error": attr("error"),
-            "success": attr("success"),
-        }.get(status_level, attr("info"))
+    def draw_status(h: int, w: int) -> None:
+        status_attr = ATTR.get(status_level, ATTR["info"])
+        # Re-slice only when the message or the width actually changed.
+        if _status_slice_cache["msg"] is not status_msg or _status_slice_cache["w"] != w:
+            _status_slice_cache["msg"] = status_msg
+            _status_slice_cache["w"] = w
+            _status_slice_cache["sliced"] = status_msg[: max(0, w - 4)]
         try:
             stdscr.move(h - 2, 0)
             stdscr.clrtoeol()
-            stdscr.addstr(h - 2, 2, status_msg[: max(0, w - 4)], status_attr | curses.A_BOLD)
+            stdscr.addstr(h - 2, 2, _status_slice_cache["sliced"], status_attr | curses.A_BOLD)
         except curses.error:
             pass
 
-        stdscr.refresh()
+    def _remember_drawn() -> None:
+        draw_state.last_mode = mode
+        draw_state.last_field_index = field_index
+        draw_state.last_action_index = action_index
+        draw_state.last_status_msg = status_msg
+        draw_state.last_status_level = status_level
+        draw_state.last_values = {key: cfg.get(key, "") for key, _ in FIELDS}
+
+    def draw_full() -> None:
+        stdscr.erase()
+        h, w = stdscr.getmaxyx()
+        title = "WOL Proxy Setup"
+        try:
+            stdscr.addstr(0, max(0, (w - len(title)) // 2), title, ATTR["background"] | curses.A_BOLD)
+        except curses.error:
+            pass
+        controls = "Up/Down select | Enter edit | D auto CIDR | Tab buttons"
+        try:
+            stdscr.addstr(1, 2, _fit(controls, w - 4), ATTR["info"] | curses.A_DIM)
+        except curses.error:
+            pass
+        for idx in range(len(FIELDS)):
+            draw_field_row(idx, w)
+        draw_help(w)
+        draw_buttons(h, w)
+        draw_status(h, w)
+        _remember_drawn()
+        stdscr.noutrefresh()
+
+    def draw_delta() -> None:
+        # Repaint only the rows whose backing state changed since the
+        # last frame; typical key presses touch two rows, not the screen.
+        h, w = stdscr.getmaxyx()
+        selection_moved = (draw_state.last_mode != mode
+                           or draw_state.last_field_index != field_index)
+        painted = False
+        for idx, (key, _) in enumerate(FIELDS):
+            value_changed = draw_state.last_values.get(key) != cfg.get(key, "")
+            if value_changed or (selection_moved and idx in (draw_state.last_field_index, field_index)):
+                draw_field_row(idx, w)
+                painted = True
+        if draw_state.last_field_index != field_index:
+            draw_help(w)
+            painted = True
+        if draw_state.last_mode != mode or draw_state.last_action_index != action_index:
+            draw_buttons(h, w)
+            painted = True
+        if (status_msg, status_level) != (draw_state.last_status_msg, draw_state.last_status_level):
+            draw_status(h, w)
+            painted = True
+        if not painted:
+            # Unhandled keys change nothing; skip curses entirely so a
+            # held-down key produces zero terminal traffic.
+            return
+        _remember_drawn()
+        stdscr.noutrefresh()
+
+    # Popups and action handlers trigger a full repaint; the key loop
+    # uses the delta path.
+    draw = draw_full
 
     def edit_field(key: str, prompt: str) -> None:
-        curses.curs_set(1)
         h, w = stdscr.getmaxyx()
         win_w = min(80, max(40, w - 6))
         win_h = 9
         win_y = max(2, (h - win_h) // 2)
         win_x = max(2, (w - win_w) // 2)
-        win = curses.newwin(win_h, win_w, win_y, win_x)
-        win.bkgd(' ', attr("background"))
-        win.erase()
-        draw_border(win)
+        win = get_popup(win_h, win_w, win_y, win_x)
 
-        help_lines = wrap(FIELD_HELP.get(key, ""), win_w - 4)
+        help_lines = _wrap_help(key, win_w - 4)
         try:
             win.addstr(1, 2, prompt, curses.A_BOLD)
             for offset, line in enumerate(help_lines[:2]):
                 win.addstr(2 + offset, 2, line, attr("info"))
             win.addstr(4, 2, "Value:", curses.A_BOLD)
             current_value = str(cfg.get(key, ""))
+            # Interior was blanked by get_popup, so no clrtoeol here
+            # (it would eat the cached right border).
             win.addstr(5, 2, current_value)
-            win.clrtoeol()
         except curses.error:
             pass
-        win.refresh()
+        win.noutrefresh()
+        curses.doupdate()
 
-        curses.echo()
+        # Toggle cursor and echo in one place right around the read, and
+        # restore them in finally so an exception cannot leave the
+        # terminal in echo mode.
         try:
+            curses.curs_set(1)
+            curses.echo()
             win.move(5, 2)
             new_value = win.getstr(5, 2, win_w - 4).decode("utf-8").strip()
         except Exception:
             new_value = ""
-        curses.noecho()
-        curses.curs_set(0)
+        finally:
+            curses.noecho()
+            curses.curs_set(0)
 
         if new_value:
             cfg[key] = new_value
+            cfg_display[key] = new_value
             set_status(f"{prompt} updated.")
         else:
             set_status(f"{prompt} unchanged.")
 
     def handle_action(action: str):
         if action == "save":
-            problems = _validate(cfg)
-            if problems:
-                set_status("; ".join(problems)[:120], "error")
+            config, results = _finalize_save(cfg)
+            if config is None:
+                set_status("; ".join(results)[:120], "error")
                 return None
-            config = Config(
-                game_server_ip=cfg["game_server_ip"],
-                game_server_mac=cfg["game_server_mac"],
-                net_cidr=int(cfg["net_cidr"]),
-                mc_port=int(cfg["mc_port"]),
-                mc_motd_idle=cfg["mc_motd_idle"],
-                mc_motd_starting=cfg["mc_motd_starting"],
-                mc_version_label=cfg["mc_version_label"],
-                satisfactory_ports=cfg["_sf_ports_list"],
-                ping_interval_sec=int(cfg["ping_interval_sec"]),
-                ping_fail_threshold=int(cfg["ping_fail_threshold"]),
-            )
-            save_config(config, DEFAULT_CONFIG_PATH)
-            summary = _run_post_install_checks()
-            show_summary("Post install checks", summary)
+            show_summary("Post install checks", results)
             set_status(f"Configuration saved to {DEFAULT_CONFIG_PATH}", "success")
             draw()
+            curses.doupdate()
             curses.napms(400)
             return 0
         if action == "cancel":
             set_status("Setup cancelled. No changes saved.")
             draw()
+            curses.doupdate()
             curses.napms(300)
             return 1
         return None
 
+    # One dict lookup per keypress resolves the operation; the tuple
+    # membership chains (and the ord() calls inside them) are gone from
+    # the hot loop.
+    field_ops = {
+        curses.KEY_UP: "up", ord('k'): "up",
+        curses.KEY_DOWN: "down", ord('j'): "down",
+        curses.KEY_ENTER: "edit", 10: "edit", 13: "edit",
+        9: "switch",  # Tab
+        ord('d'): "autodetect", ord('D'): "autodetect",
+        ord('s'): "save", ord('S'): "save",
+        ord('q'): "cancel", ord('Q'): "cancel",
+    }
+    action_ops = {
+        curses.KEY_LEFT: "left", ord('h'): "left",
+        curses.KEY_RIGHT: "right", ord('l'): "right",
+        curses.KEY_ENTER: "activate", 10: "activate", 13: "activate",
+        9: "switch", curses.KEY_UP: "switch", ord('k'): "switch",
+        ord('s'): "save", ord('S'): "save",
+        ord('q'): "cancel", ord('Q'): "cancel",
+    }
+
     draw()
+    curses.doupdate()
     while True:
         key = stdscr.getch()
         if key == curses.KEY_RESIZE:
+            _popup_cache.clear()
             draw()
+            curses.doupdate()
             continue
         if mode == "fields":
-            if key in (curses.KEY_UP, ord('k')):
+            op = field_ops.get(key)
+            if op == "up":
                 field_index = (field_index - 1) % len(FIELDS)
-            elif key in (curses.KEY_DOWN, ord('j')):
+            elif op == "down":
                 field_index = (field_index + 1) % len(FIELDS)
-            elif key in (curses.KEY_ENTER, 10, 13):
+            elif op == "edit":
                 edit_field(*FIELDS[field_index])
                 draw()
+                curses.doupdate()
                 continue
-            elif key == 9:  # Tab
+            elif op == "switch":
                 mode = "actions"
-            elif key in (ord('d'), ord('D')):
+            elif op == "autodetect":
                 ip = cfg.get("game_server_ip", "").strip()
                 if ip:
                     cidr = _autodetect_cidr(ip)
                     if cidr:
                         cfg["net_cidr"] = str(cidr)
+                        cfg_display["net_cidr"] = cfg["net_cidr"]
                         set_status(f"CIDR auto-detected: /{cidr}", "success")
                     else:
                         set_status("CIDR auto-detect failed", "error")
                 else:
                     set_status("Enter the game server IP before auto-detecting", "error")
-            elif key in (ord('s'), ord('S')):
-                result = handle_action("save")
-                if result is not None:
-                    return result
-            elif key in (ord('q'), ord('Q')):
-                result = handle_action("cancel")
+            elif op in ("save", "cancel"):
+                result = handle_action(op)
                 if result is not None:
                     return result
         else:
-            if key in (curses.KEY_LEFT, ord('h')):
+            op = action_ops.get(key)
+            if op == "left":
                 action_index = (action_index - 1) % len(actions)
-            elif key in (curses.KEY_RIGHT, ord('l')):
+            elif op == "right":
                 action_index = (action_index + 1) % len(actions)
-            elif key in (curses.KEY_ENTER, 10, 13):
+            elif op == "activate":
                 result = handle_action(actions[action_index][0])
                 if result is not None:
                     return result
-            elif key in (9, curses.KEY_UP, ord('k')):
+            elif op == "switch":
                 mode = "fields"
-            elif key in (ord('s'), ord('S')):
-                result = handle_action("save")
+            elif op in ("save", "cancel"):
+                result = handle_action(op)
                 if result is not None:
                     return result
-            elif key in (ord('q'), ord('Q')):
-                result = handle_action("cancel")
-                if result is not None:
-                    return result
-        draw()
+        draw_delta()
+        # One terminal flush per processed key, regardless of how many
+        # regions were repainted above.
+        curses.doupdate()
 
 
 def main():
@@ -534,31 +744,13 @@ def main():
             cfg["ping_fail_threshold"],
         )
 
-        problems = _validate(cfg)
-        if problems:
-            print("Errors:", "; ".join(problems))
+        config, results = _finalize_save(cfg)
+        if config is None:
+            print("Errors:", "; ".join(results))
             return 1
 
-        config = Config(
-            game_server_ip=cfg["game_server_ip"],
-            game_server_mac=cfg["game_server_mac"],
-            net_cidr=int(cfg["net_cidr"]),
-            mc_port=int(cfg["mc_port"]),
-            mc_motd_idle=cfg["mc_motd_idle"],
-            mc_motd_starting=cfg["mc_motd_starting"],
-            mc_version_label=cfg["mc_version_label"],
-            satisfactory_ports=[
-                int(port)
-                for port in cfg["satisfactory_ports"].split(',')
-                if port.strip()
-            ],
-            ping_interval_sec=int(cfg["ping_interval_sec"]),
-            ping_fail_threshold=int(cfg["ping_fail_threshold"]),
-        )
-        save_config(config, DEFAULT_CONFIG_PATH)
-        summary = _run_post_install_checks()
         print(f"Saved configuration to {DEFAULT_CONFIG_PATH}")
-        for label, level, message in summary:
+        for label, level, message in results:
             prefix = {"success": "[OK]", "info": "[info]", "error": "[error]"}.get(level, "[info]")
             first_line = message.splitlines()[0] if message else ""
             print(f"{prefix} {label}: {first_line}")
@@ -1,25 +1,140 @@
+import functools
+import os
+import select
+import socket
+import struct
 import subprocess
 import sys
 import threading
 import time
-from datetime import datetime
+
+_LOG_TS_FMT = "%Y-%m-%d %H:%M:%S"
 
 
 def log(msg: str) -> None:
-    ts = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+    # time.strftime over gmtime skips building a datetime object per
+    # line and avoids the deprecated datetime.utcnow().
+    ts = time.strftime(_LOG_TS_FMT, time.gmtime())
     print(f"[{ts} UTC] {msg}", flush=True)
 
 
-def sh(cmd: list[str]) -> tuple[int, str, str]:
-    """Run a command and return (rc, stdout, stderr)."""
-    p = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-    out, err = p.communicate()
-    return p.returncode, out, err
+def sh(cmd: list[str], timeout: float = 5.0) -> tuple[int, str, str]:
+    """Run a command and return (rc, stdout, stderr).
+
+    A hung child must never block the daemon loop, so every invocation
+    carries a hard timeout; expiry is reported like `timeout(1)` with
+    rc 124.
+    """
+    try:
+        p = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return 124, "", "timeout"
+    return p.returncode, p.stdout, p.stderr
+
+
+def parse_mac(mac: str) -> bytes:
+    """Parse a MAC address into its six raw bytes.
+
+    Accepts colon or dash separators (or none); raises ValueError for
+    anything that is not twelve hex digits. The single place MAC format
+    knowledge lives — validation and packet building both use it.
+    """
+    digits = mac.replace("-", "").replace(":", "").lower()
+    if len(digits) != 12:
+        raise ValueError(f"Invalid MAC address: {mac}")
+    try:
+        return bytes.fromhex(digits)
+    except ValueError:
+        raise ValueError(f"Invalid MAC address: {mac}") from None
+
+
+def v4_broadcast(ip: str, cidr: int) -> str:
+    """Compute the IPv4 broadcast address with plain integer math.
+
+    Much cheaper than building an ipaddress.ip_network; raises OSError for
+    non-IPv4 input so callers can fall back to the generic path.
+    """
+    ip_i = struct.unpack("!I", socket.inet_aton(ip))[0]
+    mask = (0xFFFFFFFF << (32 - cidr)) & 0xFFFFFFFF
+    return socket.inet_ntoa(struct.pack("!I", (ip_i & mask) | (~mask & 0xFFFFFFFF)))
+
+
+_icmp_sock: socket.socket | None = None
+_icmp_unavailable = False
+_icmp_seq = 0
+
+
+def _checksum(data: bytes) -> int:
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def _get_icmp_sock() -> socket.socket | None:
+    """Open one ICMP socket lazily and keep it for all probes."""
+    global _icmp_sock, _icmp_unavailable
+    if _icmp_sock is not None:
+        return _icmp_sock
+    if _icmp_unavailable:
+        return None
+    for sock_type in (socket.SOCK_DGRAM, socket.SOCK_RAW):
+        try:
+            _icmp_sock = socket.socket(socket.AF_INET, sock_type, socket.IPPROTO_ICMP)
+            _icmp_sock.setblocking(False)
+            return _icmp_sock
+        except (PermissionError, OSError):
+            continue
+    _icmp_unavailable = True
+    return None
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_v4(host: str) -> str:
+    """Resolve host to an IPv4 literal once instead of on every probe."""
+    return socket.getaddrinfo(host, None, socket.AF_INET)[0][4][0]
+
+
+def _ping_icmp(sock: socket.socket, host: str, timeout_sec: int) -> bool:
+    global _icmp_seq
+    _icmp_seq = (_icmp_seq + 1) & 0xFFFF
+    seq = _icmp_seq
+    ident = os.getpid() & 0xFFFF
+    header = struct.pack("!BBHHH", 8, 0, 0, ident, seq)
+    payload = b"wol-proxy"
+    header = struct.pack("!BBHHH", 8, 0, _checksum(header + payload), ident, seq)
+    sock.sendto(header + payload, (_resolve_v4(host), 0))
+    deadline = time.monotonic() + timeout_sec
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        readable, _, _ = select.select([sock], [], [], remaining)
+        if not readable:
+            return False
+        data, addr = sock.recvfrom(4096)
+        # Raw sockets deliver the IP header; dgram ICMP sockets do not.
+        offset = 20 if sock.type == socket.SOCK_RAW else 0
+        if len(data) < offset + 8:
+            continue
+        icmp_type, _, _, _, reply_seq = struct.unpack("!BBHHH", data[offset:offset + 8])
+        if icmp_type == 0 and reply_seq == seq:
+            return True
 
 
 def ping_host(host: str, timeout_sec: int = 1) -> bool:
-    # Use system ping (SUID root typically present). One ping, wait timeout.
-    rc, out, _ = sh(["ping", "-c", "1", "-w", str(timeout_sec), host])
+    sock = _get_icmp_sock()
+    if sock is not None:
+        try:
+            return _ping_icmp(sock, host, timeout_sec)
+        except OSError:
+            return False
+    # Fallback: system ping (SUID root typically present). One ping, wait
+    # timeout; give the child slightly longer than its own -w deadline so
+    # sh() never kills a ping that was about to answer.
+    rc, out, _ = sh(["ping", "-c", "1", "-w", str(timeout_sec), host], timeout=timeout_sec + 0.5)
     return rc == 0
 
 
@@ -40,14 +155,14 @@ class RepeatedTimer:
         self._thread.join(timeout=2)
 
     def _run(self):
-        next_time = time.time() + self.interval
-        while not self._stop.is_set():
-            now = time.time()
-            if now >= next_time:
-                try:
-                    self.func(*self.args, **self.kwargs)
-                except Exception as e:
-                    log(f"Timer function raised: {e}")
-                next_time = now + self.interval
-            time.sleep(0.05)
+        # Sleep on the stop event until the next deadline instead of
+        # polling; stop() wakes the thread immediately and the monotonic
+        # fixed-rate schedule does not drift with callback duration.
+        next_time = time.monotonic() + self.interval
+        while not self._stop.wait(max(0.0, next_time - time.monotonic())):
+            try:
+                self.func(*self.args, **self.kwargs)
+            except Exception as e:
+                log(f"Timer function raised: {e}")
+            next_time += self.interval
 
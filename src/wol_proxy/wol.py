@@ -1,17 +1,57 @@
+import atexit
+import functools
 import socket
-from .util import log
+import threading
+from .util import log, parse_mac
+
+_wol_sock: socket.socket | None = None
+_wol_lock = threading.Lock()
+
+
+def _get_wol_sock() -> socket.socket:
+    """Return the shared broadcast UDP socket, creating it on first use.
+
+    sendto on a datagram socket is atomic, so concurrent senders only
+    need the lock around creation.
+    """
+    global _wol_sock
+    if _wol_sock is None:
+        with _wol_lock:
+            if _wol_sock is None:
+                s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+                atexit.register(s.close)
+                _wol_sock = s
+    return _wol_sock
+
+
+@functools.lru_cache(maxsize=16)
+def _magic_packet(mac: str) -> bytes:
+    """Validate the MAC and build the 102-byte magic packet.
+
+    A deployment wakes one (rarely more) machine, so the packet is built
+    once per MAC string and served from cache on every later wake.
+    """
+    return b"\xff" * 6 + parse_mac(mac) * 16
 
 
 def send_magic_packet(mac: str, broadcast: str = "255.255.255.255", port: int = 9) -> None:
     """Send a Wake-on-LAN magic packet to the given MAC."""
-    mac = mac.replace("-", ":").lower()
-    parts = mac.split(":")
-    if len(parts) != 6 or not all(len(p) == 2 and all(c in "0123456789abcdef" for c in p) for p in parts):
-        raise ValueError(f"Invalid MAC address: {mac}")
-    hw = bytes(int(p, 16) for p in parts)
-    pkt = b"\xff" * 6 + hw * 16
-    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
-        s.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-        s.sendto(pkt, (broadcast, port))
+    _get_wol_sock().sendto(_magic_packet(mac), (broadcast, port))
     log(f"WOL magic packet sent to {mac} via {broadcast}:{port}")
 
+
+def send_magic_packets(mac: str, targets: list[str], port: int = 9) -> None:
+    """Send one magic packet per broadcast target over the shared socket."""
+    pkt = _magic_packet(mac)
+    s = _get_wol_sock()
+    sent: list[str] = []
+    for target in targets:
+        try:
+            s.sendto(pkt, (target, port))
+            sent.append(target)
+        except OSError as exc:
+            log(f"WOL error via {target}: {exc}")
+    if sent:
+        log(f"WOL magic packets sent to {mac} via {', '.join(sent)} (port {port})")
+